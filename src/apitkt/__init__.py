@@ -2,13 +2,16 @@
 apitkt - Lightweight toolkit for building robust API clients in Python.
 """
 
-from .client import APIClient
+from .async_client import AsyncAPIClient
+from .client import APIClient, RequestSpec
 from .log import LoggedClient
 from .exceptions import APIError, APIRequestError, APIResponseError
 
 __all__ = [
     "APIClient",
+    "AsyncAPIClient",
     "LoggedClient",
+    "RequestSpec",
     "APIError",
     "APIRequestError",
     "APIResponseError",
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Mapping, Optional, Sequence
+
+import httpx
+
+from .client import (
+    RequestSpec,
+    _DEFAULT_LIMITS,
+    _HTTP2_AVAILABLE,
+    _BaseAPIClient,
+    _normalize_method,
+)
+from .exceptions import APIRequestError, APIResponseError
+
+
+class AsyncAPIClient(_BaseAPIClient):
+    """
+    Asynchronous counterpart of APIClient built on top of httpx.AsyncClient.
+
+    The API mirrors APIClient, but every request helper is a coroutine. To
+    issue many calls concurrently, gather them on a single client::
+
+        async with AsyncAPIClient("https://api.example.com") as client:
+            responses = await asyncio.gather(
+                *(client.get(f"/items/{item_id}") for item_id in item_ids)
+            )
+
+    HTTP/2 is enabled by default when the ``h2`` package is installed
+    (``pip install apitkt[http2]``), so concurrent requests to the same host
+    are multiplexed over one connection. The connection pool still caps how
+    many requests can be in flight at once; pass ``limits`` to raise it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: float = 10.0,
+        headers: Optional[Mapping[str, str]] = None,
+        auth: Any | None = None,
+        raise_for_status: bool = True,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            raise_for_status=raise_for_status,
+        )
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=dict(headers or {}),
+            auth=auth,
+            limits=limits or _DEFAULT_LIMITS,
+            http2=_HTTP2_AVAILABLE if http2 is None else http2,
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Perform an HTTP request and return an httpx.Response.
+
+        With ``stream=True`` the body is not read up front: consume it with
+        ``response.aiter_bytes()`` / ``response.aiter_lines()`` (or
+        ``aread()``) and call ``await response.aclose()`` if it is not fully
+        iterated. APIResponseError.body is None for streamed responses.
+
+        Raises:
+            APIRequestError: for network-related problems.
+            APIResponseError: for non-success status codes (if raise_for_status=True).
+        """
+        url = self._build_url(path)
+        send_kwargs = self._pop_send_kwargs(kwargs)
+
+        try:
+            request = self._client.build_request(
+                method=_normalize_method(method),
+                url=url,
+                params=params,
+                # httpx merges these over the client's default headers
+                headers=headers,
+                json=json,
+                data=data,
+                **kwargs,
+            )
+            response = await self._client.send(request, stream=stream, **send_kwargs)
+        except httpx.RequestError as exc:
+            raise APIRequestError(f"Error while requesting {url}", exc) from exc
+
+        try:
+            self._check_response(response, preview_body=not stream)
+        except APIResponseError:
+            if stream:
+                await response.aclose()
+            raise
+        return response
+
+    # Convenience HTTP methods
+
+    async def get(
+        self,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.request("GET", path, params=params, headers=headers, **kwargs)
+
+    async def post(
+        self,
+        path: str,
+        *,
+        json: Any | None = None,
+        data: Any | None = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.request("POST", path, json=json, data=data, headers=headers, **kwargs)
+
+    async def put(
+        self,
+        path: str,
+        *,
+        json: Any | None = None,
+        data: Any | None = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.request("PUT", path, json=json, data=data, headers=headers, **kwargs)
+
+    async def delete(
+        self,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.request("DELETE", path, params=params, headers=headers, **kwargs)
+
+    async def batch(
+        self,
+        requests: Sequence[RequestSpec],
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> List[httpx.Response]:
+        """
+        Perform several requests concurrently and return their responses in
+        request order.
+
+        ``headers`` are applied to every request (per-spec headers win). If any
+        request fails, the requests still in flight are cancelled and awaited
+        before that first error is raised, so nothing from the batch keeps
+        running after batch() returns. Requests that had already completed
+        are not rolled back.
+        """
+        tasks = [
+            asyncio.ensure_future(
+                self.request(
+                    spec.method,
+                    spec.path,
+                    params=spec.params,
+                    headers=spec_headers,
+                    json=spec.json,
+                    data=spec.data,
+                )
+            )
+            for spec, spec_headers in self._iter_batch(requests, headers)
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx.AsyncClient."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        await self.aclose()
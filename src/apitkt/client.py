@@ -1,16 +1,112 @@
 from __future__ import annotations
 
+import functools
+import json as _json
 import logging
-from typing import Any, Dict, Mapping, MutableMapping, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import httpx
 
+try:  # optional fast JSON decoder
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+try:  # HTTP/2 support is optional in httpx
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HTTP2_AVAILABLE = False
+
 from .exceptions import APIRequestError, APIResponseError
 
 logger = logging.getLogger(__name__)
 
+# Connection pool used when the caller does not pass ``limits``.
+_DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+# Paths starting with any of these are passed to httpx unchanged.
+_PASSTHROUGH_PATH_PREFIXES = ("/", "http://", "https://")
+# Uppercase method names for both spellings callers commonly use.
+_HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+_METHOD_CACHE: Dict[str, str] = {
+    **{m: m for m in _HTTP_METHODS},
+    **{m.lower(): m for m in _HTTP_METHODS},
+}
+# JSON previews keep this many dict keys / list items.
+_PREVIEW_MAX_ITEMS = 10
+# JSON bodies larger than max_len * this factor are previewed as text instead.
+_JSON_PREVIEW_BYTES_PER_CHAR = 8
+# Keyword arguments accepted by httpx's send() rather than build_request().
+_SEND_KWARGS = ("auth", "follow_redirects")
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """A single request description for the client's ``batch()`` helper."""
 
-class APIClient:
+    method: str
+    path: str
+    params: Optional[Mapping[str, Any]] = None
+    headers: Optional[Mapping[str, str]] = None
+    json: Any | None = None
+    data: Any | None = None
+
+
+class _BaseAPIClient:
+    """
+    Shared configuration and helpers for the sync and async clients.
+
+    Subclasses are responsible for creating ``self._client``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: float = 10.0,
+        raise_for_status: bool = True,
+    ) -> None:
+        self.base_url = base_url.removesuffix("/")
+        self.timeout = timeout
+        self.raise_for_status = raise_for_status
+
+    def _build_url(self, path: str) -> str:
+        return _normalize_path(path)
+
+    def _iter_batch(
+        self,
+        requests: Sequence[RequestSpec],
+        headers: Optional[Mapping[str, str]],
+    ) -> Iterator[Tuple[RequestSpec, Optional[Mapping[str, str]]]]:
+        # Per-spec headers are layered over the batch-level ones with
+        # httpx.Headers so that names differing only in case override each
+        # other; httpx then merges the result over its defaults. The
+        # batch-level headers are normalized once and copied per spec.
+        shared_headers = httpx.Headers(headers) if headers else None
+        for spec in requests:
+            if spec.headers and shared_headers is not None:
+                merged_headers = shared_headers.copy()
+                merged_headers.update(spec.headers)
+                yield spec, merged_headers
+            else:
+                yield spec, spec.headers or shared_headers
+
+    @staticmethod
+    def _pop_send_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: kwargs.pop(key) for key in _SEND_KWARGS if key in kwargs}
+
+    def _check_response(self, response: httpx.Response, *, preview_body: bool = True) -> None:
+        if self.raise_for_status and not (200 <= response.status_code < 300):
+            raise APIResponseError(
+                status_code=response.status_code,
+                url=str(response.url),
+                body=_safe_body_preview(response) if preview_body else None,
+            )
+
+
+class APIClient(_BaseAPIClient):
     """
     Simple, extensible HTTP API client built on top of httpx.
 
@@ -19,6 +115,10 @@ class APIClient:
     - Default headers and auth
     - Simple request helpers (get/post/put/delete)
     - Basic error handling with custom exceptions
+
+    Connections are pooled (up to 100, 50 kept alive by default; override
+    with ``limits``) and HTTP/2 is used when the ``h2`` package is installed,
+    unless ``http2`` says otherwise.
     """
 
     def __init__(
@@ -29,28 +129,24 @@ class APIClient:
         headers: Optional[Mapping[str, str]] = None,
         auth: Any | None = None,
         raise_for_status: bool = True,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
     ) -> None:
-        if base_url.endswith("/"):
-            base_url = base_url[:-1]
-
-        self.base_url = base_url
-        self.timeout = timeout
-        self.raise_for_status = raise_for_status
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            raise_for_status=raise_for_status,
+        )
 
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=self.timeout,
             headers=dict(headers or {}),
             auth=auth,
+            limits=limits or _DEFAULT_LIMITS,
+            http2=_HTTP2_AVAILABLE if http2 is None else http2,
         )
 
-    def _build_url(self, path: str) -> str:
-        if path.startswith("http://") or path.startswith("https://"):
-            return path
-        if not path.startswith("/"):
-            path = "/" + path
-        return path
-
     def request(
         self,
         method: str,
@@ -60,46 +156,52 @@ class APIClient:
         headers: Optional[Mapping[str, str]] = None,
         json: Any | None = None,
         data: Any | None = None,
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
         """
         Perform an HTTP request and return an httpx.Response.
 
+        With ``stream=True`` the body is not read up front: consume it with
+        ``response.iter_bytes()`` / ``response.iter_lines()`` (or ``read()``)
+        and call ``response.close()`` if it is not fully iterated. Status
+        checks then only look at the status code, so APIResponseError.body
+        is None for streamed responses.
+
         Raises:
             APIRequestError: for network-related problems.
             APIResponseError: for non-success status codes (if raise_for_status=True).
         """
         url = self._build_url(path)
-
-        merged_headers: MutableMapping[str, str] = {}
-        if self._client.headers:
-            merged_headers.update(self._client.headers)
-        if headers:
-            merged_headers.update(headers)
+        send_kwargs = self._pop_send_kwargs(kwargs)
 
         try:
-            response = self._client.request(
-                method=method.upper(),
+            request = self._client.build_request(
+                method=_normalize_method(method),
                 url=url,
                 params=params,
-                headers=merged_headers,
+                # httpx merges these over the client's default headers
+                headers=headers,
                 json=json,
                 data=data,
                 **kwargs,
             )
+            response = self._client.send(request, stream=stream, **send_kwargs)
         except httpx.RequestError as exc:
             raise APIRequestError(f"Error while requesting {url}", exc) from exc
 
-        if self.raise_for_status and not (200 <= response.status_code < 300):
-            raise APIResponseError(
-                status_code=response.status_code,
-                url=str(response.url),
-                body=_safe_body_preview(response),
-            )
-
+        try:
+            self._check_response(response, preview_body=not stream)
+        except APIResponseError:
+            if stream:
+                response.close()
+            raise
         return response
 
     # Convenience HTTP methods
+    #
+    # These always delegate to request() so that subclasses overriding it
+    # (e.g. LoggedClient) observe every call.
 
     def get(
         self,
@@ -143,6 +245,32 @@ class APIClient:
     ) -> httpx.Response:
         return self.request("DELETE", path, params=params, headers=headers, **kwargs)
 
+    def batch(
+        self,
+        requests: Sequence[RequestSpec],
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> List[httpx.Response]:
+        """
+        Perform several requests and return their responses in request order.
+
+        ``headers`` are applied to every request (per-spec headers win). The
+        sync client sends the requests one after another over its pooled
+        connections; use AsyncAPIClient.batch() to send them concurrently.
+        The first failing request raises and stops the batch.
+        """
+        return [
+            self.request(
+                spec.method,
+                spec.path,
+                params=spec.params,
+                headers=spec_headers,
+                json=spec.json,
+                data=spec.data,
+            )
+            for spec, spec_headers in self._iter_batch(requests, headers)
+        ]
+
     def close(self) -> None:
         """Close the underlying httpx.Client."""
         self._client.close()
@@ -154,6 +282,71 @@ class APIClient:
         self.close()
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_path(path: str) -> str:
+    # Only depends on the path (httpx applies base_url), so the cache is
+    # shared by every client instance.
+    if path.startswith(_PASSTHROUGH_PATH_PREFIXES):
+        return path
+    return "/" + path
+
+
+def _normalize_method(method: str) -> str:
+    return _METHOD_CACHE.get(method) or method.upper()
+
+
+def _fast_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body straight from its raw bytes.
+
+    Uses orjson when it is installed and the stdlib decoder otherwise (which
+    detects UTF-8/16/32 from the bytes itself), skipping httpx's charset
+    guessing and intermediate text decode. Invalid JSON raises, as callers
+    already need to handle undecodable bodies.
+    """
+    content = response.content
+    if _orjson is not None:
+        try:
+            return _orjson.loads(content)
+        except _orjson.JSONDecodeError:
+            # orjson only accepts UTF-8; let the stdlib handle other encodings.
+            pass
+    return _json.loads(content)
+
+
+def _decode_text_prefix(response: httpx.Response, max_chars: int) -> Tuple[str, bool]:
+    """
+    Decode at most ``max_chars`` characters from the start of the body.
+
+    Only the leading bytes are decoded (4 bytes per character covers any
+    UTF-8 sequence), so large bodies are not decoded in full just to be sliced.
+    Returns the text and whether the body was longer than ``max_chars``.
+    """
+    content = response.content
+    # A memoryview slice avoids copying the leading bytes before decoding.
+    head = memoryview(content)[: max_chars * 4]
+    text = str(head, response.encoding or "utf-8", "replace")
+    truncated = len(text) > max_chars or len(head) < len(content)
+    return text[:max_chars], truncated
+
+
+def _is_json_previewable(response: httpx.Response, max_bytes: int) -> bool:
+    """Return True if the body is JSON and at most ``max_bytes`` long."""
+    content_type = response.headers.get("content-type", "")
+    return "application/json" in content_type.lower() and len(response.content) <= max_bytes
+
+
+def _truncate_preview(obj: Any, max_len: int) -> Any:
+    """Shrink a decoded JSON value to its first few items / characters."""
+    if isinstance(obj, dict):
+        return {k: obj[k] for k in list(obj)[:_PREVIEW_MAX_ITEMS]}
+    if isinstance(obj, list):
+        return obj[:_PREVIEW_MAX_ITEMS]
+    if isinstance(obj, str):
+        return obj[:max_len]
+    return obj
+
+
 def _safe_body_preview(response: httpx.Response, max_len: int = 500) -> Dict[str, Any]:
     """
     Return a small preview of the response body for debugging.
@@ -161,13 +354,12 @@ def _safe_body_preview(response: httpx.Response, max_len: int = 500) -> Dict[str
     This is meant to be used in exceptions and logs, not as full content.
     """
     try:
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type.lower():
-            obj = response.json()
-            return {"type": "json", "preview": obj}
-        text = response.text
-        if len(text) > max_len:
-            text = text[: max_len - 3] + "..."
+        if _is_json_previewable(response, max_len * _JSON_PREVIEW_BYTES_PER_CHAR):
+            obj = _fast_json(response)
+            return {"type": "json", "preview": _truncate_preview(obj, max_len)}
+        text, truncated = _decode_text_prefix(response, max_len)
+        if truncated:
+            text = f"{text[: max_len - 3]}..."
         return {"type": "text", "preview": text}
     except Exception:
         return {"type": "unknown", "preview": None}
\ No newline at end of file
@@ -6,18 +6,32 @@ from typing import Any, Optional
 class APIError(Exception):
     """Base exception for apitkt-related errors."""
 
+    __slots__ = ()
+
 
 class APIRequestError(APIError):
     """Errors raised before receiving a response (network issues, timeouts, etc.)."""
 
+    __slots__ = ("original_exception",)
+
     def __init__(self, message: str, original_exception: Optional[BaseException] = None) -> None:
         super().__init__(message)
         self.original_exception = original_exception
 
+    def __reduce__(self) -> Any:
+        # Slot values are not part of BaseException's default pickle state.
+        return (
+            type(self),
+            (self.args[0], self.original_exception),
+            self.__dict__ or None,
+        )
+
 
 class APIResponseError(APIError):
     """Errors raised when a non-success HTTP response is returned."""
 
+    __slots__ = ("status_code", "url", "body")
+
     def __init__(
         self,
         status_code: int,
@@ -30,6 +44,14 @@ class APIResponseError(APIError):
         self.url = url
         self.body = body
 
+    def __reduce__(self) -> Any:
+        # Slot values are not part of BaseException's default pickle state.
+        return (
+            type(self),
+            (self.status_code, self.args[0], self.url, self.body),
+            self.__dict__ or None,
+        )
+
     def __str__(self) -> str:
         base = super().__str__()
         if self.url:
@@ -2,27 +2,112 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Mapping, Optional
+from typing import AbstractSet, Any, Callable, Mapping, Optional
 
 import httpx
 
-from .client import APIClient
+from .client import (
+    APIClient,
+    _decode_text_prefix,
+    _fast_json,
+    _is_json_previewable,
+    _normalize_method,
+    _truncate_preview,
+)
 
 logger = logging.getLogger("apitkt.log")
 
 
+# Lowercased keys whose values are redacted in logs. These are mutable so
+# callers can extend them, e.g. SENSITIVE_HEADER_KEYS.add("x-api-key").
 SENSITIVE_HEADER_KEYS = {"authorization", "proxy-authorization"}
 SENSITIVE_JSON_KEYS = {"password", "token", "access_token", "refresh_token", "secret"}
 
+_REDACTED = "***redacted***"
+_PREVIEW_LEN = 200
+# Logged JSON bodies up to this size keep a response_json_preview field (and
+# are decoded for it); larger ones are logged as a text preview instead.
+_JSON_PREVIEW_MAX_BYTES = 1024 * 1024
+_PREVIEW_ERROR = "<could not read response body>"
+# Attribute used to keep the JSON body decoded for logging on the response.
+_PARSED_JSON_ATTR = "_apitkt_parsed_json"
 
-def _redact_mapping(data: Mapping[str, Any], sensitive_keys: set[str]) -> dict[str, Any]:
-    redacted: dict[str, Any] = {}
-    for key, value in data.items():
-        if key.lower() in sensitive_keys:
-            redacted[key] = "***redacted***"
-        else:
-            redacted[key] = value
-    return redacted
+
+def _redact_mapping(data: Mapping[str, Any], sensitive_keys: AbstractSet[str]) -> dict[str, Any]:
+    # sensitive_keys must already be lowercased
+    if not data:
+        return {}
+    return {
+        key: _REDACTED if key.lower() in sensitive_keys else value
+        for key, value in data.items()
+    }
+
+
+class _LazyValue:
+    """
+    A log field computed only when it is first rendered.
+
+    Formatters call str() on extra fields they reference, so previews that
+    are never formatted are never computed.
+    """
+
+    __slots__ = ("_func", "_args", "_value", "_evaluated")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        self._func = func
+        self._args = args
+        self._value: Any = None
+        self._evaluated = False
+
+    @property
+    def value(self) -> Any:
+        if not self._evaluated:
+            self._value = self._func(*self._args)
+            self._evaluated = True
+            self._func = self._args = None  # drop references to the response
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+    def __reduce__(self) -> Any:
+        # Pickle the computed preview only, never the response it came from
+        # (SocketHandler, QueueHandler across processes, etc.).
+        return (_LazyValue, (_identity, self.value))
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _parsed_json(response: httpx.Response) -> Any:
+    try:
+        return getattr(response, _PARSED_JSON_ATTR)
+    except AttributeError:
+        body = _fast_json(response)
+        setattr(response, _PARSED_JSON_ATTR, body)
+        return body
+
+
+def _json_log_preview(response: httpx.Response) -> Any:
+    try:
+        body = _parsed_json(response)
+    except Exception:
+        return _PREVIEW_ERROR
+    if isinstance(body, dict):
+        return _truncate_preview(body, _PREVIEW_LEN)
+    return "<non-dict json payload>"
+
+
+def _text_log_preview(response: httpx.Response) -> str:
+    try:
+        text, truncated = _decode_text_prefix(response, _PREVIEW_LEN)
+    except Exception:
+        return _PREVIEW_ERROR
+    return f"{text}..." if truncated else text
 
 
 class LoggedClient(APIClient):
@@ -33,6 +118,13 @@ class LoggedClient(APIClient):
     - method, path, status code
     - elapsed time in ms
     - optionally request/response metadata (without sensitive values)
+
+    The ``response_json_preview`` / ``response_text_preview`` record fields
+    are lazy wrappers rather than plain values: the body is only decoded
+    when a formatter renders them with str()/repr(). Structured handlers
+    should read ``record.response_json_preview.value`` to get the
+    underlying dict (or string). A body that cannot be decoded yields
+    ``"<could not read response body>"`` as the preview value.
     """
 
     def __init__(
@@ -45,6 +137,10 @@ class LoggedClient(APIClient):
         super().__init__(*args, **kwargs)
         self.log_headers = log_headers
         self.log_body_preview = log_body_preview
+        # Client defaults are converted to a plain dict once instead of per
+        # request; they are still redacted per request so later additions to
+        # SENSITIVE_HEADER_KEYS apply.
+        self._logged_default_headers = dict(self._client.headers)
 
     def request(
         self,
@@ -55,9 +151,24 @@ class LoggedClient(APIClient):
         headers: Optional[Mapping[str, str]] = None,
         json: Any | None = None,
         data: Any | None = None,
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
-        start = time.perf_counter()
+        method = _normalize_method(method)
+        if not logger.isEnabledFor(logging.INFO):
+            # Nothing would be emitted, so skip timing and metadata collection.
+            return super().request(
+                method,
+                path,
+                params=params,
+                headers=headers,
+                json=json,
+                data=data,
+                stream=stream,
+                **kwargs,
+            )
+
+        start = time.perf_counter_ns()
         try:
             response = super().request(
                 method,
@@ -66,15 +177,16 @@ class LoggedClient(APIClient):
                 headers=headers,
                 json=json,
                 data=data,
+                stream=stream,
                 **kwargs,
             )
         finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
 
         extra: dict[str, Any] = {
-            "method": method.upper(),
+            "method": method,
             "path": path,
-            "elapsed_ms": round(elapsed_ms, 2),
+            "elapsed_ms": elapsed_ms,
         }
 
         if params:
@@ -82,10 +194,9 @@ class LoggedClient(APIClient):
 
         if self.log_headers:
             # Headers from the underlying client and the request-specific ones
-            combined_headers = {}
-            combined_headers.update(dict(self._client.headers))
+            combined_headers = dict(self._logged_default_headers)
             if headers:
-                combined_headers.update(dict(headers))
+                combined_headers.update(headers)
             extra["request_headers"] = _redact_mapping(
                 combined_headers,
                 SENSITIVE_HEADER_KEYS,
@@ -98,25 +209,26 @@ class LoggedClient(APIClient):
             else:
                 extra["request_json"] = "<non-dict json payload>"
 
-        if self.log_body_preview:
-            try:
-                content_type = response.headers.get("content-type", "")
-                extra["response_content_type"] = content_type
-                if "application/json" in content_type.lower():
-                    body = response.json()
-                    if isinstance(body, dict):
-                        extra["response_json_preview"] = {
-                            k: body[k] for k in list(body.keys())[:10]
-                        }
-                    else:
-                        extra["response_json_preview"] = "<non-dict json payload>"
-                else:
-                    text = response.text
-                    extra["response_text_preview"] = text[:200] + ("..." if len(text) > 200 else "")
-            except Exception:
-                extra["response_preview_error"] = "could not read response body"
+        # Streamed bodies belong to the caller and are never read for logging.
+        # Response previews are lazy: they are only decoded if a formatter
+        # actually renders them.
+        if self.log_body_preview and not stream:
+            extra["response_content_type"] = response.headers.get("content-type", "")
+            if _is_json_previewable(response, _JSON_PREVIEW_MAX_BYTES):
+                extra["response_json_preview"] = _LazyValue(_json_log_preview, response)
+            else:
+                extra["response_text_preview"] = _LazyValue(_text_log_preview, response)
 
         extra["status_code"] = response.status_code
 
         logger.info("api_call", extra=extra)
-        return response
\ No newline at end of file
+        return response
+
+    def json(self, response: httpx.Response) -> Any:
+        """
+        Return the decoded JSON body of a response returned by this client.
+
+        Reuses the value already decoded for the log preview when there is
+        one, so logged JSON responses are not parsed twice.
+        """
+        return _parsed_json(response)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from apitkt import APIResponseError, AsyncAPIClient, RequestSpec
+
+
+def _mock_client(handler) -> AsyncAPIClient:
+    client = AsyncAPIClient("https://example.com/", http2=False)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_async_client_gathers_requests_in_order():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run() -> list[httpx.Response]:
+        async with _mock_client(handler) as client:
+            return await asyncio.gather(*(client.get(f"items/{i}") for i in range(3)))
+
+    responses = asyncio.run(run())
+    assert [r.json()["path"] for r in responses] == ["/items/0", "/items/1", "/items/2"]
+
+
+def test_async_client_raises_response_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": "not found"})
+
+    async def run() -> None:
+        async with _mock_client(handler) as client:
+            await client.get("/missing")
+
+    with pytest.raises(APIResponseError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.body == {"type": "json", "preview": {"error": "not found"}}
+
+
+def test_async_batch_applies_shared_headers():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"path": request.url.path, "tag": request.headers.get("x-tag")},
+        )
+
+    async def run() -> list[httpx.Response]:
+        async with _mock_client(handler) as client:
+            return await client.batch(
+                [
+                    RequestSpec("GET", "a"),
+                    RequestSpec("GET", "b", headers={"X-Tag": "own"}),
+                ],
+                headers={"X-Tag": "shared"},
+            )
+
+    responses = asyncio.run(run())
+    assert [r.json() for r in responses] == [
+        {"path": "/a", "tag": "shared"},
+        {"path": "/b", "tag": "own"},
+    ]
+
+
+def test_async_batch_spec_headers_override_case_insensitively():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"tags": request.headers.get_list("x-tag")})
+
+    async def run() -> list[httpx.Response]:
+        async with _mock_client(handler) as client:
+            return await client.batch(
+                [RequestSpec("GET", "a", headers={"X-Tag": "own"})],
+                headers={"x-tag": "shared"},
+            )
+
+    (response,) = asyncio.run(run())
+    assert response.json() == {"tags": ["own"]}
+
+
+def test_async_batch_cancels_pending_requests_on_first_error():
+    finished: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/bad":
+            return httpx.Response(500)
+        await asyncio.sleep(0.2)
+        finished.append(request.url.path)
+        return httpx.Response(200)
+
+    async def run() -> None:
+        async with _mock_client(handler) as client:
+            with pytest.raises(APIResponseError):
+                await client.batch(
+                    [
+                        RequestSpec("POST", "slow1"),
+                        RequestSpec("GET", "bad"),
+                        RequestSpec("POST", "slow2"),
+                    ]
+                )
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            assert pending == []
+            await asyncio.sleep(0.3)
+
+    asyncio.run(run())
+    assert finished == []
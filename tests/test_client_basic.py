@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from apitkt.client import APIClient
+import httpx
+import pytest
+
+from apitkt import APIResponseError, RequestSpec
+from apitkt.client import APIClient, _safe_body_preview
+
+
+def _mock_client(handler) -> APIClient:
+    client = APIClient("https://example.com")
+    client._client = httpx.Client(
+        base_url=client.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
 
 
 def test_client_builds_url_without_double_slash():
@@ -12,4 +25,118 @@ def test_client_builds_url_without_double_slash():
 
 def test_client_does_not_mutate_base_url():
     client = APIClient("https://example.com/")
-    assert client.base_url == "https://example.com"
\ No newline at end of file
+    assert client.base_url == "https://example.com"
+
+
+def test_safe_body_preview_decodes_json():
+    response = httpx.Response(
+        400,
+        headers={"content-type": "application/json"},
+        content=b'{"error": "bad request"}',
+    )
+    assert _safe_body_preview(response) == {
+        "type": "json",
+        "preview": {"error": "bad request"},
+    }
+
+
+def test_client_build_url_normalizes_paths():
+    client = APIClient("https://example.com")
+    assert client._build_url("test") == "/test"
+    assert client._build_url("") == "/"
+    assert client._build_url("https://other.example.com/x") == "https://other.example.com/x"
+
+
+def test_safe_body_preview_truncates_text():
+    response = httpx.Response(
+        500,
+        headers={"content-type": "text/plain; charset=utf-8"},
+        content=("é" * 1000).encode("utf-8"),
+    )
+    preview = _safe_body_preview(response, max_len=10)
+    assert preview == {"type": "text", "preview": "é" * 7 + "..."}
+
+
+def test_client_streams_response_without_reading_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=iter([b"line1\n", b"line2\n"]))
+
+    client = _mock_client(handler)
+    response = client.get("/lines", stream=True)
+    with pytest.raises(httpx.ResponseNotRead):
+        response.content
+    assert list(response.iter_lines()) == ["line1", "line2"]
+
+
+def test_safe_body_preview_truncates_json():
+    response = httpx.Response(
+        422,
+        headers={"content-type": "application/json"},
+        json={"errors": list(range(50))},
+    )
+    preview = _safe_body_preview(response)
+    assert preview == {"type": "json", "preview": {"errors": list(range(50))}}
+
+    response = httpx.Response(
+        422,
+        headers={"content-type": "application/json"},
+        json=list(range(50)),
+    )
+    assert _safe_body_preview(response)["preview"] == list(range(10))
+
+
+def test_safe_body_preview_falls_back_to_text_for_large_json():
+    response = httpx.Response(
+        500,
+        headers={"content-type": "application/json"},
+        json={"blob": "x" * 10_000},
+    )
+    preview = _safe_body_preview(response)
+    assert preview["type"] == "text"
+    assert len(preview["preview"]) == 500
+
+
+def test_safe_body_preview_decodes_utf16_json():
+    response = httpx.Response(
+        400,
+        headers={"content-type": "application/json"},
+        content='{"error": "bad"}'.encode("utf-16"),
+    )
+    assert _safe_body_preview(response) == {"type": "json", "preview": {"error": "bad"}}
+
+
+def test_client_batch_returns_responses_in_order_with_shared_headers():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"path": request.url.path, "tags": request.headers.get_list("x-tag")},
+        )
+
+    client = _mock_client(handler)
+    responses = client.batch(
+        [
+            RequestSpec("GET", "a"),
+            RequestSpec("POST", "b", headers={"X-Tag": "own"}),
+            RequestSpec("GET", "c"),
+        ],
+        headers={"x-tag": "shared"},
+    )
+    assert [r.json() for r in responses] == [
+        {"path": "/a", "tags": ["shared"]},
+        {"path": "/b", "tags": ["own"]},
+        {"path": "/c", "tags": ["shared"]},
+    ]
+
+
+def test_client_batch_stops_at_first_failure():
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(500 if request.url.path == "/bad" else 200)
+
+    client = _mock_client(handler)
+    with pytest.raises(APIResponseError) as excinfo:
+        client.batch([RequestSpec("GET", "a"), RequestSpec("GET", "bad"), RequestSpec("GET", "c")])
+    assert excinfo.value.status_code == 500
+    assert seen == ["/a", "/bad"]
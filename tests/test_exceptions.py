@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+from apitkt import APIRequestError, APIResponseError
+
+
+def test_response_error_survives_pickle_and_copy():
+    error = APIResponseError(500, url="http://x", body={"type": "json", "preview": {"a": 1}})
+    error.note = "extra"
+    for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+        assert clone.status_code == 500
+        assert clone.url == "http://x"
+        assert clone.body == {"type": "json", "preview": {"a": 1}}
+        assert clone.note == "extra"
+        assert str(clone) == "HTTP 500 error (url=http://x)"
+
+
+def test_request_error_survives_pickle():
+    error = APIRequestError("Error while requesting /x", ValueError("boom"))
+    clone = pickle.loads(pickle.dumps(error))
+    assert str(clone) == "Error while requesting /x"
+    assert isinstance(clone.original_exception, ValueError)
+    assert clone.original_exception.args == ("boom",)
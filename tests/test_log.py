@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import pickle
+
+import httpx
+import pytest
+
+from apitkt import LoggedClient, RequestSpec
+from apitkt.log import SENSITIVE_HEADER_KEYS
+
+
+def _mock_client(handler, **kwargs) -> LoggedClient:
+    client = LoggedClient("https://example.com", **kwargs)
+    client._client = httpx.Client(
+        base_url=client.base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_logged_client_redacts_headers_and_previews_json(caplog):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"] == "Bearer secret"
+        assert request.headers["x-request"] == "1"
+        return httpx.Response(200, json={"ok": True})
+
+    client = _mock_client(handler, headers={"Authorization": "Bearer secret"})
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        client.post("/login", json={"user": "a", "password": "b"}, headers={"X-Request": "1"})
+
+    (record,) = caplog.records
+    assert record.method == "POST"
+    assert record.status_code == 200
+    assert record.request_headers["authorization"] == "***redacted***"
+    assert record.request_headers["X-Request"] == "1"
+    assert record.request_json == {"user": "a", "password": "***redacted***"}
+    assert record.response_json_preview.value == {"ok": True}
+    assert str(record.response_json_preview) == str({"ok": True})
+
+
+def test_logged_client_json_reuses_logged_body(caplog, monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 1})
+
+    client = _mock_client(handler)
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        response = client.get("/item")
+    # Rendering the preview decodes the body
+    assert caplog.records[0].response_json_preview.value == {"id": 1}
+
+    monkeypatch.setattr("apitkt.log._fast_json", lambda response: pytest.fail("parsed twice"))
+    assert client.json(response) == {"id": 1}
+
+
+def test_logged_client_previews_are_lazy(caplog, monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 1})
+
+    client = _mock_client(handler)
+    monkeypatch.setattr("apitkt.log._fast_json", lambda response: pytest.fail("parsed eagerly"))
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        client.get("/item")
+    assert caplog.records[0].status_code == 200
+
+
+def test_logged_client_honours_extended_sensitive_keys(caplog, monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(204)
+
+    client = _mock_client(handler, headers={"X-Api-Key": "secret"})
+    monkeypatch.setattr("apitkt.log.SENSITIVE_HEADER_KEYS", SENSITIVE_HEADER_KEYS | {"x-api-key"})
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        client.get("/item")
+    assert caplog.records[0].request_headers["x-api-key"] == "***redacted***"
+
+
+def test_logged_client_keeps_json_preview_for_ordinary_bodies(caplog):
+    body = {f"key{i}": "x" * 100 for i in range(20)}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=body)
+
+    client = _mock_client(handler)
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        response = client.get("/item")
+
+    (record,) = caplog.records
+    assert len(response.content) > 2000
+    assert not hasattr(record, "response_text_preview")
+    assert record.response_json_preview.value == {f"key{i}": "x" * 100 for i in range(10)}
+
+
+def test_logged_client_reports_undecodable_body_in_preview(caplog):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=b"{oops")
+
+    client = _mock_client(handler)
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        client.get("/item")
+
+    (record,) = caplog.records
+    assert record.response_json_preview.value == "<could not read response body>"
+    assert not hasattr(record, "response_preview_error")
+
+
+def test_logged_client_records_pickle_without_response(caplog):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/plain"}, content=b"x" * 500_000)
+
+    client = _mock_client(handler)
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        client.get("/item")
+
+    (record,) = caplog.records
+    # SocketHandler pickles with protocol 1 after a 4-byte length prefix
+    data = logging.handlers.SocketHandler("localhost", 1).makePickle(record)
+    restored = logging.makeLogRecord(pickle.loads(data[4:]))
+    assert restored.response_text_preview.value == "x" * 200 + "..."
+
+    payload = pickle.dumps(record.__dict__)
+    assert len(payload) < 10_000
+    assert pickle.loads(payload)["response_text_preview"].value == "x" * 200 + "..."
+
+
+def test_logged_client_logs_each_batch_call(caplog):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = _mock_client(handler)
+    with caplog.at_level(logging.INFO, logger="apitkt.log"):
+        client.batch([RequestSpec("get", "a"), RequestSpec("POST", "/b")])
+
+    assert [(r.method, r.path, r.status_code) for r in caplog.records] == [
+        ("GET", "a", 200),
+        ("POST", "/b", 200),
+    ]
+
+
+def test_logged_client_skips_log_work_when_info_disabled(caplog, monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 1})
+
+    def fail(*args, **kwargs):
+        pytest.fail("log metadata built while INFO is disabled")
+
+    client = _mock_client(handler, headers={"Authorization": "Bearer secret"})
+    monkeypatch.setattr("apitkt.log._redact_mapping", fail)
+    monkeypatch.setattr("apitkt.log._LazyValue", fail)
+    with caplog.at_level(logging.WARNING, logger="apitkt.log"):
+        response = client.post("/item", json={"password": "x"}, headers={"X-Request": "1"})
+        streamed = client.get("/item", stream=True)
+
+    assert caplog.records == []
+    assert response.json() == {"id": 1}
+    assert streamed.status_code == 200
+    assert streamed.read() == b'{"id":1}'